@@ -1,5 +1,6 @@
 import fs from 'node:fs';
 import path from 'node:path';
+import { pipeline } from 'node:stream/promises';
 import { ZyphraClient as Zyphra } from '@zyphra/client';
 import fetch from 'node-fetch';
 import type { Config } from '../types/index.js';
@@ -38,12 +39,16 @@ export class ZonosTTS extends BaseTTS {
         );
       }
 
-      // Save the audio file
-      const buffer = Buffer.from(await response.arrayBuffer());
+      if (!response.body) {
+        throw new Error('Zonos TTS server returned an empty response body');
+      }
+
+      // Stream the audio to disk rather than buffering it in memory and
+      // blocking the event loop with a synchronous write
       const outputDir = this.config.outputDir;
       const outputFile = path.join(outputDir, `tts_output_${Date.now()}.wav`);
 
-      fs.writeFileSync(outputFile, buffer);
+      await pipeline(response.body, fs.createWriteStream(outputFile));
       logger.info(`Generated TTS audio: ${outputFile}`);
 
       return outputFile;
@@ -1,5 +1,6 @@
 import fs from 'node:fs';
 import path from 'node:path';
+import { pipeline } from 'node:stream/promises';
 import { PutObjectCommand, S3Client } from '@aws-sdk/client-s3';
 import { fal } from '@fal-ai/client';
 import FormData from 'form-data';
@@ -41,12 +42,16 @@ export class LocalLatentSync extends BaseVideoSync {
         );
       }
 
-      // Save the video file
-      const buffer = Buffer.from(await response.arrayBuffer());
+      if (!response.body) {
+        throw new Error('LatentSync server returned an empty response body');
+      }
+
+      // Stream the video to disk rather than buffering it in memory and
+      // blocking the event loop with a synchronous write
       const outputDir = this.config.outputDir;
       const outputFile = path.join(outputDir, `video_${Date.now()}.mp4`);
 
-      fs.writeFileSync(outputFile, buffer);
+      await pipeline(response.body, fs.createWriteStream(outputFile));
       logger.info(`Generated synchronized video: ${outputFile}`);
 
       return outputFile;